@@ -1,17 +1,105 @@
+import hashlib
 import io
+import heapq
 import time
 import os
 import logging
+import multiprocessing
+import queue
 import tempfile
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
-from PyPDF2 import PdfReader, PdfWriter
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pypdf import PdfReader, PdfWriter
 from markitdown import MarkItDown
 
 
 _log = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+# PDFs malformados mas recuperáveis geram uma enxurrada de warnings do pypdf a cada página
+logging.getLogger("pypdf").setLevel(logging.ERROR)
+
+MD_ROOT = Path("results/MD")
+# markdown já convertido, indexado pelo hash do PDF de 1 página (páginas repetidas entre PDFs/execuções)
+CACHE_DIR = MD_ROOT / ".cache"
+
+
+@dataclass(slots=True)
+class PdfJob:
+    """
+    Estado de agendamento de um PDF: próxima página a submeter, lotes em execução,
+    tamanho médio estimado de uma página (para o orçamento de memória) e se já foi iniciado.
+    """
+    path: str
+    num_pages: int
+    outdir: str
+    next_page: int = 1
+    outstanding: int = 0
+    page_bytes: int = 0
+    active: bool = False
+
+
+class NamedBytesIO(io.BytesIO):
+    """
+    BytesIO com `name`, para que o MarkItDown consiga inferir a extensão do stream
+    sem precisar de um arquivo temporário em disco.
+    """
+    name = "page.pdf"
+
+
+def _load_reader(pdf_path: str, mtime: float) -> tuple[PdfReader, threading.Lock]:
+    """
+    Lê o PDF inteiro para a memória uma única vez e devolve um PdfReader reaproveitável,
+    junto com o lock que serializa o acesso a ele (PdfReader não é thread-safe).
+    O `mtime` faz parte da chave para invalidar o cache se o arquivo mudar em disco.
+    """
+    return PdfReader(io.BytesIO(Path(pdf_path).read_bytes()), strict=False), threading.Lock()
+
+
+_cached_reader = lru_cache(maxsize=8)(_load_reader)
+
+
+def set_reader_cache_size(size: int) -> None:
+    """
+    Redimensiona (e esvazia) o cache de readers; o agendador o ajusta ao número de PDFs ativos.
+    """
+    global _cached_reader
+    if _cached_reader.cache_parameters()["maxsize"] != size:
+        _cached_reader = lru_cache(maxsize=size)(_load_reader)
+
+
+def get_reader(pdf_path: str) -> tuple[PdfReader, threading.Lock]:
+    """
+    Retorna o PdfReader em cache (por processo) para `pdf_path` e o seu lock.
+    Threads diferentes podem recortar PDFs diferentes ao mesmo tempo.
+    """
+    path = Path(pdf_path)
+    return _cached_reader(str(path), path.stat().st_mtime)
+
+
+@lru_cache(maxsize=2)
+def get_markitdown(enable_plugins: bool = False) -> MarkItDown:
+    """
+    Retorna uma instância de MarkItDown reaproveitada durante toda a vida do processo,
+    evitando refazer o registro de conversores/plugins a cada página.
+    """
+    return MarkItDown(enable_plugins=enable_plugins)
+
+
+# configurado uma vez por worker via `init_worker`, em vez de ser enviado a cada submit
+_enable_plugins = False
+
+
+def init_worker(enable_plugins: bool = False) -> None:
+    """
+    Initializer do ProcessPoolExecutor: fixa `enable_plugins` no worker e já deixa o MarkItDown pronto
+    (com fork é só um acerto no cache herdado do pai).
+    """
+    global _enable_plugins
+    _enable_plugins = enable_plugins
+    get_markitdown(enable_plugins)
 
 
 def page_to_bytesio(pdf_path: str, page_number: int) -> io.BytesIO | None:
@@ -20,15 +108,16 @@ def page_to_bytesio(pdf_path: str, page_number: int) -> io.BytesIO | None:
     Retorna BytesIO pronto para leitura (pos 0) ou None se falhar.
     """
     try:
-        reader = PdfReader(str(pdf_path))
-        idx = page_number - 1
-        if idx < 0 or idx >= len(reader.pages):
-            _log.error(f"Página fora do range: {page_number} em {pdf_path}")
-            return None
-        writer = PdfWriter()
-        writer.add_page(reader.pages[idx])
-        bio = io.BytesIO()
-        writer.write(bio)
+        reader, lock = get_reader(pdf_path)
+        with lock:
+            idx = page_number - 1
+            if idx < 0 or idx >= len(reader.pages):
+                _log.error(f"Página fora do range: {page_number} em {pdf_path}")
+                return None
+            writer = PdfWriter()
+            writer.add_page(reader.pages[idx])
+            bio = NamedBytesIO()
+            writer.write(bio)
         bio.seek(0)
         return bio
     except Exception as e:
@@ -36,133 +125,352 @@ def page_to_bytesio(pdf_path: str, page_number: int) -> io.BytesIO | None:
         return None
 
 
-def process_page(pdf_path: str, page_number: int, outdir: str, enable_plugins: bool = False) -> dict:
+def write_bytes_atomic(path: Path, payload: bytes) -> None:
+    """
+    Grava `payload` com um único write de bytes (sem a camada TextIOWrapper) em um .tmp
+    e renomeia, para que uma execução interrompida não deixe arquivo parcial.
+    O .tmp leva o pid porque workers diferentes podem gravar a mesma entrada do cache.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def page_md_path(pdf_path: str, page_number: int, outdir: str) -> Path:
+    """
+    Caminho do markdown de uma página: <outdir>/<pdfstem>_page_<N>.md
+    """
+    return Path(outdir) / f"{Path(pdf_path).stem}_page_{page_number}.md"
+
+
+def md_header(pdf_path: str, page_number: int) -> str:
+    return f"# {Path(pdf_path).stem} — página {page_number}\n\n"
+
+
+def is_page_done(pdf_path: str, page_number: int, outdir: str) -> bool:
+    """
+    True se a página já tem um markdown com conteúdo além do cabeçalho (execução anterior).
+    """
+    try:
+        size = page_md_path(pdf_path, page_number, outdir).stat().st_size
+    except OSError:
+        return False
+    return size > len(md_header(pdf_path, page_number).encode("utf-8"))
+
+
+def cache_path_for(data: bytes | memoryview) -> Path:
+    """
+    Entrada do cache para um PDF de 1 página. O resultado do MarkItDown depende dos plugins,
+    então o flag entra na chave.
+    """
+    digest = hashlib.blake2b(data, digest_size=16, person=b"plugins" if _enable_plugins else b"base").hexdigest()
+    return CACHE_DIR / f"{digest}.md"
+
+
+def write_page_md(pdf_path: str, page_number: int, outdir: str, text: str) -> Path:
+    md_path = page_md_path(pdf_path, page_number, outdir)
+    write_bytes_atomic(md_path, f"{md_header(pdf_path, page_number)}{text.strip()}".encode("utf-8"))
+    return md_path
+
+
+def slice_pages(pdf_path: str, page_numbers: list[int], outdir: str) -> tuple[list[tuple[int, bytes]], list[dict]]:
+    """
+    Recorta as páginas em PDFs de 1 página (bytes), para rodar em threads do processo pai.
+    Páginas já presentes no cache são gravadas aqui mesmo e não vão para os workers.
+    Retorna (páginas a converter, resultados das páginas resolvidas ou que falharam).
+    """
+    Path(outdir).mkdir(parents=True, exist_ok=True)
+    pages, done = [], []
+    for pg in page_numbers:
+        bio = page_to_bytesio(pdf_path, pg)
+        if bio is None:
+            done.append({"status": "err", "msg": "failed to create single-page pdf", "pdf": pdf_path, "page": pg})
+            continue
+        try:
+            text = cache_path_for(bio.getbuffer()).read_text(encoding="utf-8")
+        except OSError:
+            pages.append((pg, bio.getvalue()))
+            continue
+        try:
+            md_path = write_page_md(pdf_path, pg, outdir, text)
+            done.append({"status": "ok", "msg": "cached", "pdf": pdf_path, "page": pg, "md": str(md_path)})
+        except OSError as e:
+            done.append({"status": "err", "msg": str(e), "pdf": pdf_path, "page": pg})
+    return pages, done
+
+
+def convert_page_pdf(bio: io.BytesIO) -> str | None:
+    """
+    Converte um PDF de 1 página em memória com o MarkItDown.
+    Retorna o texto extraído ou None.
+    """
+    md = get_markitdown(_enable_plugins)
+
+    stream_failed = False
+    try:
+        result = md.convert_stream(bio, file_extension=".pdf")
+        text = getattr(result, "text_content", None)
+    except Exception as e_stream:
+        _log.debug(f"MarkItDown.convert_stream falhou: {e_stream}; tentando fallback para arquivo temporário.")
+        text = None
+        stream_failed = True
+
+    # fallback: só quando o stream falhou; uma conversão bem-sucedida sem texto daria o mesmo resultado pelo arquivo
+    if stream_failed:
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmpf:
+                tmp_path = Path(tmpf.name)
+                tmpf.write(bio.getbuffer())
+            result = md.convert(str(tmp_path))
+            text = getattr(result, "text_content", None)
+        finally:
+            try:
+                if tmp_path is not None and tmp_path.exists():
+                    tmp_path.unlink()
+            except Exception:
+                pass
+
+    return text
+
+
+def process_page(pdf_path: str, page_number: int, outdir: str, data: bytes | None = None) -> dict:
     """
     Salva o resultado em results/MD/<pdfstem>/<pdfstem>_page_<N>.md
+    Se `data` (PDF de 1 página já recortado) não for passado, a página é recortada aqui.
     Retorna dict com status e metadados.
     """
     start = time.time()
-    path = Path(pdf_path)
-    outdir_p = Path(outdir)
-    outdir_p.mkdir(parents=True, exist_ok=True)
-    page_id = f"{path.stem}_page_{page_number}"
-    md_path = outdir_p / f"{page_id}.md"
+    Path(outdir).mkdir(parents=True, exist_ok=True)
 
     try:
-        bio = page_to_bytesio(pdf_path, page_number)
+        bio = page_to_bytesio(pdf_path, page_number) if data is None else NamedBytesIO(data)
         if bio is None:
             return {"status": "err", "msg": "failed to create single-page pdf", "pdf": pdf_path, "page": page_number}
 
-        md = MarkItDown(enable_plugins=enable_plugins)
-
+        cache_path = cache_path_for(bio.getbuffer())
         try:
-            result = md.convert(bio)
-            text = getattr(result, "text_content", None)
-        except Exception as e_stream:
-            _log.debug(f"MarkItDown.convert(stream) falhou: {e_stream}; tentando fallback para arquivo temporário.")
+            text = cache_path.read_text(encoding="utf-8")
+            cached = True
+        except OSError:
             text = None
+            cached = False
 
-        # fallback: escrever um arquivo temporário e chamar md.convert(path)
-        if not text:
-            try:
-                with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmpf:
-                    tmp_path = Path(tmpf.name)
-                    tmpf.write(bio.getvalue())
-                result = md.convert(str(tmp_path))
-                text = getattr(result, "text_content", None)
-            finally:
-                try:
-                    if 'tmp_path' in locals() and tmp_path.exists():
-                        tmp_path.unlink()
-                except Exception:
-                    pass
+        if not cached:
+            text = convert_page_pdf(bio)
+            if text:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                write_bytes_atomic(cache_path, text.encode("utf-8"))
 
         if not text:
             return {"status": "err", "msg": "MarkItDown não retornou texto", "pdf": pdf_path, "page": page_number}
 
-        # salvar markdown
-        with md_path.open("w", encoding="utf-8") as f:
-            f.write(f"# {path.stem} — página {page_number}\n\n")
-            f.write(text.strip())
+        md_path = write_page_md(pdf_path, page_number, outdir, text)
 
         elapsed = time.time() - start
-        return {"status": "ok", "msg": f"converted in {elapsed:.2f}s", "pdf": pdf_path, "page": page_number, "md": str(md_path)}
+        msg = "cached" if cached else f"converted in {elapsed:.2f}s"
+        return {"status": "ok", "msg": msg, "pdf": pdf_path, "page": page_number, "md": str(md_path)}
     except Exception as e:
         _log.exception("Erro no worker process_pdf_page_markitdown")
         return {"status": "err", "msg": str(e), "pdf": pdf_path, "page": page_number}
 
 
-def export_documents(input_doc_paths: list[Path], max_workers: int | None = None, max_outstanding: int | None = None, per_pdf_limit: int = 2, enable_plugins: bool = False):
+def process_page_batch(pdf_path: str, pages: list[tuple[int, bytes]], outdir: str) -> list[dict]:
+    """
+    Converte várias páginas já recortadas (número, bytes) do mesmo PDF em um único job do worker,
+    reaproveitando o MarkItDown em cache.
+    Retorna uma lista com o dict de resultado de cada página.
+    """
+    return [process_page(pdf_path, pg, outdir, data) for pg, data in pages]
+
+
+def count_pages(pdf_path: Path) -> int | None:
+    """
+    Conta as páginas percorrendo a árvore de páginas (o /Count de PDFs malformados pode mentir).
+    Retorna None se o PDF não puder ser lido.
+    """
+    try:
+        reader = PdfReader(str(pdf_path), strict=False)
+        return len(reader.pages)
+    except Exception as e:
+        _log.error(f"Falha lendo PDF {pdf_path}: {e}")
+        return None
+
+
+def export_documents(input_doc_paths: list[Path], max_workers: int | None = None, max_outstanding: int | None = None, per_pdf_limit: int = 2, enable_plugins: bool = False, batch_size: int | None = None, slicer_workers: int = 2, max_outstanding_bytes: int = 512 * 1024 * 1024):
     """
     - max_workers: máximo de cpus que serão usadas
-    - per_pdf_limit: quantas páginas do mesmo PDF podem estar em execução simultânea
+    - per_pdf_limit: quantos lotes do mesmo PDF podem estar em execução simultânea
+      (cada lote roda suas páginas em sequência em um worker, então é o paralelismo por PDF)
     - max_outstanding: máximo de futures submetidos simultaneamente (proteção de memória)
+    - batch_size: máximo de páginas consecutivas do mesmo PDF enviadas em um único job; o lote diminui
+      para distribuir as páginas restantes entre os lotes livres do PDF
+    - slicer_workers: threads do processo pai que recortam as páginas antes da conversão
+    - max_outstanding_bytes: orçamento de memória para páginas recortadas em trânsito
     """
     start_all = time.time()
     cpu = os.cpu_count() or 1
     max_workers = max_workers or max(1, cpu - 1)
     max_outstanding = max_outstanding or max_workers * 4
+    batch_size = batch_size or 8
+    # PDFs abertos ao mesmo tempo: o suficiente para ocupar todos os workers com per_pdf_limit lotes cada,
+    # mais um para o próximo PDF começar enquanto os últimos lotes de outro terminam
+    max_active = -(-max_workers // max(1, per_pdf_limit)) + 1
+    set_reader_cache_size(max_active)
+
+    _log.info(f"Parâmetros usados: max_workers={max_workers}, max_outstanding={max_outstanding}, per_pdf_limit={per_pdf_limit}, batch_size={batch_size}, max_active={max_active}, max_outstanding_bytes={max_outstanding_bytes}")
 
-    _log.info(f"Parâmetros usados: max_workers={max_workers}, max_outstanding={max_outstanding}, per_pdf_limit={per_pdf_limit}")
+    pdf_paths = [p for p in input_doc_paths if p.suffix.lower() == ".pdf"]
+    with ThreadPoolExecutor(max_workers=8) as tp:
+        counts = list(tp.map(count_pages, pdf_paths))
 
     pdfs = []
-    for p in input_doc_paths:
-        if p.suffix.lower() == ".pdf":
-            try:
-                reader = PdfReader(str(p))
-                num_pages = len(reader.pages)
-                pdfs.append({"path": str(p), "num_pages": num_pages, "next_page": 1, "outdir": str(Path("results/MD") / p.stem)})
-            except Exception as e:
-                _log.error(f"Falha lendo PDF {p}: {e}")
+    for p, num_pages in zip(pdf_paths, counts):
+        if num_pages is None:
+            continue
+        page_bytes = p.stat().st_size // max(1, num_pages)
+        pdfs.append(PdfJob(path=str(p), num_pages=num_pages, outdir=str(MD_ROOT / p.stem), page_bytes=page_bytes))
 
-    total_pages = sum(p["num_pages"] for p in pdfs)
+    total_pages = sum(job.num_pages for job in pdfs)
     _log.info(f"Total de páginas a processar: {total_pages}")
 
     futures = {}
-    per_pdf_outstanding = defaultdict(int)
-
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        while any(p["next_page"] <= p["num_pages"] for p in pdfs) or futures:
-            # enfileirar enquanto houver espaço
-            while len(futures) < max_outstanding:
-                submitted = False
-                for p in pdfs:
-                    if p["next_page"] <= p["num_pages"] and per_pdf_outstanding[p["path"]] < per_pdf_limit:
-                        pg = p["next_page"]
-                        try:
-                            fut = executor.submit(process_page, p["path"], pg, p["outdir"], enable_plugins)
-                            futures[fut] = {"pdf": p["path"], "page": pg}
-                            per_pdf_outstanding[p["path"]] += 1
-                            p["next_page"] += 1
-                            submitted = True
+    # cada future se coloca nesta fila ao terminar; evita registrar waiters em todos os futures a cada iteração
+    done_q = queue.SimpleQueue()
+    # heap de (índice, next_page, outstanding) com os PDFs elegíveis; entradas desatualizadas são descartadas ao sair do heap.
+    # ordenar pelo índice termina os PDFs já iniciados antes de abrir novos; no máximo max_active ficam abertos,
+    # o mesmo tamanho do cache de readers, para cada PDF ser lido uma única vez
+    heap = []
+    active = 0
+    remaining = total_pages
+    # bytes reservados pelas páginas em trânsito: estimativa ao recortar, tamanho real depois do recorte
+    outstanding_bytes = 0
+    skipped = 0
+
+    def push(i):
+        nonlocal active
+        job = pdfs[i]
+        if job.active and job.next_page > job.num_pages and job.outstanding == 0:
+            job.active = False
+            active -= 1
+        if job.next_page <= job.num_pages and job.outstanding < per_pdf_limit:
+            heapq.heappush(heap, (i, job.next_page, job.outstanding))
+
+    for i in range(len(pdfs)):
+        push(i)
+
+    def log_results(results, meta):
+        for res in results:
+            if res and res.get("status") == "ok":
+                _log.info(f"OK: {res.get('pdf')} page {res.get('page')} -> {res.get('md')} ({res.get('msg')})")
+            else:
+                _log.error(f"ERR: {res} for {meta}")
+
+    # aquece o MarkItDown no processo pai: com fork os workers herdam os módulos e a instância em cache (copy-on-write)
+    init_worker(enable_plugins)
+    mp_context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+
+    # pipeline: recorte (threads no pai) -> conversão (processos); `futures` conta as duas etapas para respeitar max_outstanding
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context, initializer=init_worker, initargs=(enable_plugins,)) as executor:
+        # com fork, o primeiro submit cria todos os workers: faz isso antes de existirem threads de recorte,
+        # para os filhos não herdarem locks possivelmente ocupados
+        executor.submit(int).result()
+        with ThreadPoolExecutor(max_workers=slicer_workers) as slicer:
+            while remaining > 0 or futures:
+                # enfileirar enquanto houver espaço
+                while len(futures) < max_outstanding and heap:
+                    i, next_page, outstanding = heapq.heappop(heap)
+                    job = pdfs[i]
+                    if outstanding != job.outstanding or next_page != job.next_page:
+                        continue
+                    if not job.active:
+                        if active >= max_active:
+                            # já há max_active PDFs abertos (e no cache de readers); espera algum terminar
+                            heapq.heappush(heap, (i, next_page, outstanding))
                             break
-                        except Exception as e:
-                            _log.exception(f"Falha ao submeter página {pg} de {p['path']}: {e}")
-                            p["next_page"] += 1
-                if not submitted:
-                    break
+                        job.active = True
+                        active += 1
+                    pg = job.next_page
+                    left = job.num_pages - pg + 1
+                    # não concentra o fim do PDF em um lote só: divide o que resta entre os lotes livres
+                    count = min(batch_size, -(-left // (per_pdf_limit - outstanding)))
+                    estimate = job.page_bytes * count
+                    if futures and outstanding_bytes + estimate > max_outstanding_bytes:
+                        # sem orçamento: devolve a entrada ao heap e espera alguma conclusão liberar memória
+                        heapq.heappush(heap, (i, next_page, outstanding))
+                        break
+                    pages = [n for n in range(pg, pg + count) if not is_page_done(job.path, n, job.outdir)]
+                    job.next_page += count
+                    remaining -= count
+                    skipped += count - len(pages)
+                    if not pages:
+                        # todas já convertidas numa execução anterior
+                        push(i)
+                        continue
+                    estimate = job.page_bytes * len(pages)
+                    try:
+                        fut = slicer.submit(slice_pages, job.path, pages, job.outdir)
+                        futures[fut] = {"stage": "slice", "pdf": job.path, "index": i, "pages": pages, "bytes": estimate}
+                        fut.add_done_callback(done_q.put)
+                        job.outstanding += 1
+                        outstanding_bytes += estimate
+                    except Exception as e:
+                        _log.exception(f"Falha ao submeter páginas {pages} de {job.path}: {e}")
+                    push(i)
 
-            if not futures:
-                time.sleep(0.05)
-                continue
+                if not futures:
+                    # nada em execução: ou tudo já foi submetido/pulado, ou não há como progredir (limites inválidos)
+                    if remaining:
+                        _log.error(f"Nenhuma página pôde ser submetida (per_pdf_limit={per_pdf_limit}, max_outstanding={max_outstanding}); abortando.")
+                    break
 
-            done, _ = wait(futures.keys(), return_when=FIRST_COMPLETED)
-            for fut in done:
+                fut = done_q.get()
                 meta = futures.pop(fut)
-                res = None
+                results = []
                 try:
-                    res = fut.result()
+                    results = fut.result()
                 except Exception as e:
                     _log.exception(f"Future falhou: {e}")
 
-                pdf_path = meta["pdf"]
-                per_pdf_outstanding[pdf_path] = max(0, per_pdf_outstanding[pdf_path] - 1)
+                if meta["stage"] == "slice" and results:
+                    # só as páginas fora do cache seguem para os workers; as demais já foram gravadas no recorte
+                    sliced, results = results
+                    if sliced:
+                        # troca a estimativa pelo tamanho real das páginas recortadas
+                        actual = sum(len(data) for _, data in sliced)
+                        outstanding_bytes += actual - meta["bytes"]
+                        meta = {**meta, "bytes": actual}
+                        try:
+                            conv = executor.submit(process_page_batch, meta["pdf"], sliced, pdfs[meta["index"]].outdir)
+                            futures[conv] = {**meta, "stage": "convert"}
+                            conv.add_done_callback(done_q.put)
+                        except Exception as e:
+                            _log.exception(f"Falha ao submeter conversão de {[pg for pg, _ in sliced]} de {meta['pdf']}: {e}")
+                            results += [{"status": "err", "msg": str(e), "pdf": meta["pdf"], "page": pg} for pg, _ in sliced]
+                            sliced = []
+                    log_results(results, meta)
+                    if sliced:
+                        continue
+                    results = None
+
+                job = pdfs[meta["index"]]
+                job.outstanding = max(0, job.outstanding - 1)
+                outstanding_bytes -= meta["bytes"]
+                push(meta["index"])
 
-                if res and res.get("status") == "ok":
-                    _log.info(f"OK: {res.get('pdf')} page {res.get('page')} -> {res.get('md')} ({res.get('msg')})")
-                else:
-                    _log.error(f"ERR: {res} for {meta}")
+                if results is not None:
+                    if not results:
+                        _log.error(f"ERR: nenhum resultado para {meta}")
+                    log_results(results, meta)
 
+    if skipped:
+        _log.info(f"{skipped} páginas já convertidas anteriormente foram puladas.")
     total_elapsed = time.time() - start_all
     _log.info(f"Todos processados em {total_elapsed:.2f}s.")
 
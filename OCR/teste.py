@@ -9,6 +9,8 @@ ydl_opts = {
     "format": "bestaudio/best",
     "quiet": True,
     "no_warnings": True,
+    # só precisamos dos metadados: não expandir playlists
+    "extract_flat": "in_playlist",
     "postprocessors": [{
         "key": "FFmpegExtractAudio",
         "preferredcodec": "mp3",
@@ -16,6 +18,6 @@ ydl_opts = {
     }]}
 
 with YoutubeDL(ydl_opts) as ydl:
-    info = ydl.(url, download=False)
+    info = ydl.extract_info(url, download=False)
 
 print(info)
\ No newline at end of file
@@ -8,6 +8,29 @@ class MarkItDownYouTube:
         self.md = MarkItDown()
         self.workdir = Path(workdir)
         self.workdir.mkdir(exist_ok=True)
+        self._ydl_opts = {
+            "ffmpeg_location": r"C:\ffmpeg\bin\ffmpeg.exe",
+            "outtmpl": str(self.workdir / "%(id)s.%(ext)s"),
+            "format": "bestaudio/best",
+            "quiet": True,
+            "no_warnings": True,
+            "postprocessors": [{
+                "key": "FFmpegExtractAudio",
+                "preferredcodec": "mp3",
+                "preferredquality": "192",
+            }],
+        }
+        # instância única reaproveitada entre vídeos (conexões, cookies e extratores já carregados)
+        self._ydl = YoutubeDL(self._ydl_opts)
+
+    def close(self):
+        self._ydl.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
     def convert_youtube(self, video_id_or_url):
         """
@@ -36,28 +59,15 @@ class MarkItDownYouTube:
             print(f"⚠ Erro ao pegar transcript: {e}. Caindo para yt-dlp...")
 
         # --- Fallback: baixar áudio com yt-dlp ---
-        ydl_opts = {
-            "ffmpeg_location": r"C:\ffmpeg\bin\ffmpeg.exe",
-            "outtmpl": str(self.workdir / "%(id)s.%(ext)s"),
-            "format": "bestaudio/best",
-            "quiet": True,
-            "no_warnings": True,
-            "postprocessors": [{
-                "key": "FFmpegExtractAudio",
-                "preferredcodec": "mp3",
-                "preferredquality": "192",
-            }],
-        }
-
-        with YoutubeDL(ydl_opts) as ydl:
-            ydl.extract_info(video_id_or_url, download=True)
+        info = self._ydl.extract_info(video_id_or_url, download=True)
 
-        audio_file = next(self.workdir.glob("*.mp3"), None)
-        if audio_file:
+        # o FFmpegExtractAudio troca a extensão do arquivo baixado para .mp3
+        audio_file = Path(self._ydl.prepare_filename(info)).with_suffix(".mp3")
+        if audio_file.exists():
             print(f"✔ Áudio baixado: {audio_file}")
             return self.md.convert(str(audio_file)).text_content
 
         raise RuntimeError("Não foi possível extrair texto do vídeo.")
 
-md = MarkItDownYouTube()
-print(md.convert_youtube(video_id_or_url="https://www.youtube.com/watch?v=7Vg3WozBypI"))
\ No newline at end of file
+with MarkItDownYouTube() as md:
+    print(md.convert_youtube(video_id_or_url="https://www.youtube.com/watch?v=7Vg3WozBypI"))
\ No newline at end of file